@@ -3,6 +3,67 @@ import pandas as pd
 import numpy as np
 import re
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional; VehHistoryTransform falls back to its regex scan
+    njit = None
+
+try:
+    import pyarrow  # noqa: F401  (only probed for availability)
+    _HAS_PYARROW = True
+except ImportError:
+    # pyarrow is optional; ArrowStringTransform becomes a no-op without it
+    _HAS_PYARROW = False
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _find_bytes(buf, start, end, needle):
+        m = needle.shape[0]
+        for i in range(start, end - m + 1):
+            match = True
+            for k in range(m):
+                if buf[i + k] != needle[k]:
+                    match = False
+                    break
+            if match:
+                return i
+        return -1
+
+    @njit(cache=True, parallel=True)
+    def _parse_history_buffer(buf, offsets, patterns,
+                              num_owners, accident, non_personal, title_issues, buyback):
+        owner_pat, accident_pat, nonpersonal_pat, title_pat, buyback_pat = patterns
+        for i in prange(offsets.shape[0] - 1):
+            start = offsets[i]
+            end = offsets[i + 1] - 1  # exclude the row separator byte
+            j = _find_bytes(buf, start, end, owner_pat)
+            if j != -1:
+                # parse the digits directly preceding ' owner'
+                k = j - 1
+                while k >= start and buf[k] == 32:
+                    k -= 1
+                value = 0.0
+                scale = 1.0
+                found_digit = False
+                while k >= start and 48 <= buf[k] <= 57:
+                    value += (buf[k] - 48) * scale
+                    scale *= 10.0
+                    k -= 1
+                    found_digit = True
+                if found_digit:
+                    num_owners[i] = value
+            if _find_bytes(buf, start, end, accident_pat) != -1:
+                accident[i] = 1
+            if _find_bytes(buf, start, end, nonpersonal_pat) != -1:
+                non_personal[i] = 1
+            if _find_bytes(buf, start, end, title_pat) != -1:
+                title_issues[i] = 1
+            if _find_bytes(buf, start, end, buyback_pat) != -1:
+                buyback[i] = 1
+
 class SetIndex(BaseEstimator, TransformerMixin):
     """
     Transforms a pd.DataFrame by setting a feature as its index.
@@ -11,22 +72,27 @@ class SetIndex(BaseEstimator, TransformerMixin):
     ----------
     index_feature : str
         The feature to be set as the DataFrame index.
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
-    def __init__(self, index_feature):
+    def __init__(self, index_feature, copy=True):
         self.index_feature = index_feature
-    
+        self.copy = copy
+
     def fit(self, X, y=None):
         return self
 
     def transform(self, X, y=None):
-        X_copy = X.copy()
-        X_copy.set_index(self.index_feature, inplace=True)
-        return X_copy
-    
+        if not self.copy:
+            X.set_index(self.index_feature, inplace=True)
+            return X
+        # set_index already returns a new frame sharing the data blocks
+        return X.set_index(self.index_feature)
+
 class DropUnused(BaseEstimator, TransformerMixin):
     """
     Transformer that drops specified features from a pd.DataFrame.
-    
+
     Parameters:
     ----------
     features : list
@@ -36,73 +102,134 @@ class DropUnused(BaseEstimator, TransformerMixin):
         self.features = features
 
     def fit(self, X, y=None):
+        # remember the columns to keep so transform can select positively
+        dropped = set(self.features)
+        self._keep_ = [col for col in X.columns if col not in dropped]
         return self
 
     def transform(self, X, y=None):
-        X_copy = X.copy()
-        return X_copy.drop(self.features, axis=1)
-    
+        # positive selection shares the kept column blocks and never touches
+        # the dropped ones
+        return X.loc[:, self._keep_]
+
 class LogTransform(BaseEstimator, TransformerMixin):
     """
     Applies a log transformation on specified features of a pd.DataFrame.
     Handles NaN values by filling them with the mean of the transformed feature.
-    
+
     Parameters:
     ----------
     features : list
         List of features to apply the log transformation.
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
-    def __init__(self, features):
+    def __init__(self, features, copy=True):
         self.features = features
+        self.copy = copy
         self.feature_means_ = {}
 
     def fit(self, X, y=None):
-        X_copy = X.copy()
-        
-        for feature in self.features:
-            X_copy[feature] = np.log1p(X_copy[feature])
-            self.feature_means_[feature] = X_copy[feature].mean()
+        # one log1p call over the whole 2-D block instead of one per column
+        arr = X[self.features].to_numpy(dtype=np.float64, copy=True)
+        np.log1p(arr, out=arr)
+        means = np.nanmean(arr, axis=0)
+        self.feature_means_ = dict(zip(self.features, means))
         return self
 
     def transform(self, X, y=None):
-        X_copy = X.copy()
-        for feature in self.features:
-            X_copy[feature] = np.log1p(X_copy[feature])
-            X_copy[feature].fillna(self.feature_means_[feature], inplace=True)
-        return X_copy    
-    
+        if self.copy:
+            X = X.copy(deep=False)
+        arr = np.log1p(X[self.features].to_numpy(dtype=np.float64))
+        # fill each NaN with the fit-time mean of its column
+        mask = np.isnan(arr)
+        means = np.array([self.feature_means_[feature] for feature in self.features])
+        arr[mask] = np.take(means, np.where(mask)[1])
+        X[self.features] = arr
+        return X
+
 class BooleanEncoding(BaseEstimator, TransformerMixin):
     """
     Converts specified features from boolean to integer representation.
-    
+
     Parameters:
     ----------
     features : list
         List of features to be converted to int.
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
-    def __init__(self, features):
+    def __init__(self, features, copy=True):
         self.features = features
+        self.copy = copy
 
     def fit(self, X, y=None):
         return self
 
     def transform(self, X, y=None):
-        X_copy = X.copy()
+        if self.copy:
+            X = X.copy(deep=False)
         for feature in self.features:
-            X_copy[feature] = X_copy[feature].astype(int)
-        return X_copy
-    
+            X[feature] = X[feature].astype(int)
+        return X
+
+class ArrowStringTransform(BaseEstimator, TransformerMixin):
+    """
+    Casts string columns to the PyArrow-backed string dtype so downstream
+    .str operations run on Arrow's contiguous buffers instead of one Python
+    object per row. No-op when pyarrow is not installed.
+
+    Parameters:
+    ----------
+    features : list or None, default=None
+        String columns to cast. If None, every object/string column found
+        during fit is cast.
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
+    """
+    def __init__(self, features=None, copy=True):
+        self.features = features
+        self.copy = copy
+
+    def fit(self, X, y=None):
+        if self.features is not None:
+            self._string_cols_ = list(self.features)
+        else:
+            self._string_cols_ = [col for col in X.columns
+                                  if pd.api.types.is_object_dtype(X[col])
+                                  or pd.api.types.is_string_dtype(X[col])]
+        return self
+
+    def transform(self, X, y=None):
+        if not _HAS_PYARROW:
+            return X
+        if self.copy:
+            X = X.copy(deep=False)
+        for col in self._string_cols_:
+            X[col] = X[col].astype('string[pyarrow]')
+        return X
+
+
 class ColumnNameTransformer(BaseEstimator, TransformerMixin):
     """
     Transforms column names of a pd.DataFrame by replacing spaces with underscores.
+
+    Parameters:
+    ----------
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
+    def __init__(self, copy=True):
+        self.copy = copy
+
     def fit(self, X, y=None):
         return self
 
     def transform(self, X, y=None):
-        X_copy = X.copy()
-        X_copy.columns = [col.replace(' ', '_') for col in X_copy.columns]
-        return X_copy
+        if self.copy:
+            X = X.copy(deep=False)
+        X.columns = [col.replace(' ', '_') for col in X.columns]
+        return X
     
     
 class AgeFeatureTransform(BaseEstimator, TransformerMixin):
@@ -113,130 +240,224 @@ class AgeFeatureTransform(BaseEstimator, TransformerMixin):
     ----------
     current_year : int
         The current year used to calculate the vehicle's age.
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
-    def __init__(self, current_year):
+    def __init__(self, current_year, copy=True):
         self.current_year = current_year
+        self.copy = copy
 
     def fit(self, X, y=None):
         return self
 
     def transform(self, X, y=None):
-        X_copy = X.copy()
-        X_copy['VehAge'] = self.current_year - X_copy['VehYear']
-        X_copy.drop('VehYear', axis=1, inplace=True)
-        return X_copy
-    
-    
+        if self.copy:
+            X = X.copy(deep=False)
+        # int16 subtraction on the raw array: quarter the width of int64
+        years = X['VehYear'].to_numpy(dtype=np.int16)
+        X['VehAge'] = np.int16(self.current_year) - years
+        X.drop('VehYear', axis=1, inplace=True)
+        return X
+
+
 class VehHistoryTransform(BaseEstimator, TransformerMixin):
     """
     Extracts and transforms various vehicle history information from a text feature.
     Imputes missing values with most frequent value present in the column.
+
+    Parameters:
+    ----------
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
-    def __init__(self):
+    _flag_features = ['AccidentReported', 'NonPersonalUse', 'TitleIssues', 'BuybackProtection']
+
+    def __init__(self, copy=True):
+        self.copy = copy
         self.imputation_dict_ = {}
 
     def fit(self, X, y=None):
 
-        X_temp = self._transform_logic(X.copy())  
-        
+        X_temp = self._transform_logic(X.copy(deep=False))
+
         self.imputation_dict_['Num_Owners'] = X_temp['Num_Owners'].mode()[0]
         self.imputation_dict_['AccidentReported'] = X_temp['AccidentReported'].mode()[0]
         self.imputation_dict_['NonPersonalUse'] = X_temp['NonPersonalUse'].mode()[0]
         self.imputation_dict_['TitleIssues'] = X_temp['TitleIssues'].mode()[0]
         self.imputation_dict_['BuybackProtection'] = X_temp['BuybackProtection'].mode()[0]
 
+        # keep the fit-time result so fit_transform on the same frame does
+        # not repeat the regex scan
+        self._fit_cache_id = id(X)
+        self._fit_cache = X_temp
+
         return self
 
     def transform(self, X, y=None):
-        X_copy = self._transform_logic(X.copy())
-        for feature in self.imputation_dict_:
-            # for each feature we impute NaNs with most frequent and than conver to int
-            X_copy[feature].fillna(self.imputation_dict_[feature], inplace=True)
-            X_copy[feature] = X_copy[feature].astype(int)        
-         
-        return X_copy
+        if getattr(self, '_fit_cache', None) is not None and self._fit_cache_id == id(X):
+            X_out, self._fit_cache = self._fit_cache, None
+        else:
+            X_out = self._transform_logic(X.copy(deep=False) if self.copy else X)
+
+        # impute NaNs with most frequent in the same pass as the int cast
+        owners = X_out['Num_Owners'].to_numpy()
+        X_out['Num_Owners'] = np.where(np.isnan(owners), self.imputation_dict_['Num_Owners'],
+                                       owners).astype(np.int32, copy=False)
+        for feature in self._flag_features:
+            # the flags leave _transform_logic as NaN-free bools; cast only
+            X_out[feature] = X_out[feature].to_numpy().astype(np.uint8, copy=False)
+
+        return X_out
+
+    # one alternation regex covering all five history flags, compiled once
+    _history_re = re.compile(
+        r'(?P<owners>\d+) owner'
+        r'|(?P<accident>accident\(s\) reported)'
+        r'|(?P<nonpersonal>non-personal use reported)'
+        r'|(?P<title>title issue\(s\) reported)'
+        r'|(?P<buyback>buyback protection eligible)',
+        re.IGNORECASE)
+
+    # below this many rows the regex scan wins; the numba path only pays for
+    # its buffer packing and JIT warm-up on large frames
+    _numba_min_rows = 100_000
+    _byte_patterns = tuple(np.frombuffer(literal.encode(), dtype=np.uint8) for literal in
+                           ('owner', 'accident(s) reported', 'non-personal use reported',
+                            'title issue(s) reported', 'buyback protection eligible'))
 
     def _transform_logic(self, df):
-        # Extract number of owners and create a new column
-        df['Num_Owners'] = df['VehHistory'].str.extract(r'(\d+) Owner').astype(float)
-        # Check if accidents were reported
-        df['AccidentReported'] = df['VehHistory'].str.contains(r'Accident\(s\) Reported').astype(bool)
-         # Check if non-personal use was reported
-        df['NonPersonalUse'] = df['VehHistory'].str.contains('Non-Personal Use Reported').astype(bool)
-         # Check for title issues
-        df['TitleIssues'] = df['VehHistory'].str.contains(r'Title Issue\(s\) Reported').astype(bool)
-        # Check for buyback protection eligibility
-        df['BuybackProtection'] = df['VehHistory'].str.contains('Buyback Protection Eligible').astype(bool)
+        # single pass over the column: every flag is extracted from one
+        # scan per row instead of five separate str passes
+        history = df['VehHistory'].to_numpy()
+        n = len(history)
+
+        num_owners = np.full(n, np.nan, dtype=np.float32)
+        accident = np.zeros(n, dtype=np.uint8)
+        non_personal = np.zeros(n, dtype=np.uint8)
+        title_issues = np.zeros(n, dtype=np.uint8)
+        buyback = np.zeros(n, dtype=np.uint8)
+
+        if njit is not None and n >= self._numba_min_rows:
+            self._parse_numba(history, num_owners, accident, non_personal, title_issues, buyback)
+        else:
+            self._parse_regex(history, num_owners, accident, non_personal, title_issues, buyback)
+
+        df['Num_Owners'] = num_owners
+        df['AccidentReported'] = accident.astype(bool)
+        df['NonPersonalUse'] = non_personal.astype(bool)
+        df['TitleIssues'] = title_issues.astype(bool)
+        df['BuybackProtection'] = buyback.astype(bool)
 
         df.drop('VehHistory', axis=1, inplace=True)
-        
+
         return df
+
+    def _parse_regex(self, history, num_owners, accident, non_personal, title_issues, buyback):
+        for i, value in enumerate(history):
+            if not isinstance(value, str):
+                continue
+            for match in self._history_re.finditer(value):
+                if match.group('owners') is not None:
+                    num_owners[i] = float(match.group('owners'))
+                elif match.group('accident') is not None:
+                    accident[i] = 1
+                elif match.group('nonpersonal') is not None:
+                    non_personal[i] = 1
+                elif match.group('title') is not None:
+                    title_issues[i] = 1
+                else:
+                    buyback[i] = 1
+
+    def _parse_numba(self, history, num_owners, accident, non_personal, title_issues, buyback):
+        # pack the lowercased rows into one contiguous NUL-separated byte
+        # buffer so the compiled scanner avoids per-row object indirection
+        rows = [value.lower() if isinstance(value, str) else '' for value in history]
+        buf = np.frombuffer(('\x00'.join(rows) + '\x00').encode('utf-8'), dtype=np.uint8)
+        offsets = np.concatenate(([0], np.flatnonzero(buf == 0) + 1)).astype(np.int64)
+        _parse_history_buffer(buf, offsets, self._byte_patterns,
+                              num_owners, accident, non_personal, title_issues, buyback)
     
     
 class VehEngineTransform(BaseEstimator, TransformerMixin):
     """
-    Extracts and categorizes information about the vehicle's engine by creating two 
+    Extracts and categorizes information about the vehicle's engine by creating two
     new features: Displacement & Engine_Category.
+
+    Parameters:
+    ----------
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
+    # compiled once at class creation, reused by every transform call
+    _displacement_re = re.compile(r'(\d+\.\d+)')
+    _engine_types = ['turbo', 'supercharged', 'diesel', 'hemi']
+    _engine_categories = [etype.capitalize() for etype in _engine_types] + ['Other']
+
+    def __init__(self, copy=True):
+        self.copy = copy
+
     def fit(self, X, y=None):
         return self
-    
+
     def transform(self, X, y=None):
-        X_transformed = X.copy()
+        if self.copy:
+            X = X.copy(deep=False)
 
-        X_transformed['Displacement'] = X_transformed['VehEngine'].apply(self._get_displacement)
-        X_transformed['Engine_Category'] = X_transformed['VehEngine'].apply(self._categorize_engine)
-        
-        X_transformed.drop('VehEngine', axis=1, inplace=True)
-        
-        return X_transformed
-    
-    def _get_displacement(self, engine):
-        if pd.isna(engine) or not isinstance(engine, str):
-            return 0
-        match = re.search(r'(\d+\.\d+)', engine)
-        
-        return float(match.group(1)) if match else 0
+        # single lowercase pass, then vectorized .str ops instead of per-row apply
+        engine = X['VehEngine'].fillna('').astype(str).str.lower()
+
+        displacement = engine.str.extract(self._displacement_re, expand=False)
+        X['Displacement'] = pd.to_numeric(displacement, errors='coerce').fillna(0.0)
+
+        # plain bool arrays so np.select also works on nullable/arrow dtypes
+        conditions = [engine.str.contains(etype, regex=False).to_numpy(dtype=bool)
+                      for etype in self._engine_types]
+        X['Engine_Category'] = pd.Categorical(
+            np.select(conditions, self._engine_categories[:-1], default='Other'),
+            categories=self._engine_categories)
 
-    def _categorize_engine(self, engine):
-        engine_types = ['turbo', 'supercharged', 'diesel', 'hemi']
+        X.drop('VehEngine', axis=1, inplace=True)
 
-        if pd.isna(engine) or not isinstance(engine, str):
-            return 'Other'
-        for etype in engine_types:
-            if etype in engine.lower():
-                return etype.capitalize()
-        return 'Other'
+        return X
         
         
         
 class VehColorExtTransform(BaseEstimator, TransformerMixin):
     """
     Categorizes external vehicle colors into basic colors.
+
+    Parameters:
+    ----------
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
+    _base_colors = ['Black', 'White', 'Red', 'Silver', 'Blue', 'Gray', 'Brown', 'Gold']
+    # (needle, label) pairs lowercased once instead of per transform call
+    _base_colors_lc = [(base.lower(), base) for base in _base_colors]
+
+    def __init__(self, copy=True):
+        self.copy = copy
+
     def fit(self, X, y=None):
         return self
-    
+
     def transform(self, X, y=None):
-        X_transformed = X.copy()
-        
+        if self.copy:
+            X = X.copy(deep=False)
+
+        # one lowercase pass + a vectorized substring scan per base color
+        color = X['VehColorExt'].str.lower()
+        # plain bool arrays so np.select also works on nullable/arrow dtypes
+        conditions = [color.str.contains(needle, na=False, regex=False).to_numpy(dtype=bool)
+                      for needle, _ in self._base_colors_lc]
+        basic = np.select(conditions, self._base_colors, default='Other')
         # impute NaN with White
-        def basic_color(color):
-            if pd.isna(color):
-                return 'White'
-            elif not isinstance(color, str):
-                return 'Other'
-
-            base_colors = ['Black', 'White', 'Red', 'Silver', 'Blue', 'Gray', 'Brown', 'Gold']
-            for base in base_colors:
-                if base.lower() in color.lower():
-                    return base
-            return 'Other'
-
-        X_transformed['BasicExtColor'] = X_transformed['VehColorExt'].apply(basic_color)
-        X_transformed.drop('VehColorExt', axis=1, inplace=True)
-        
-        return X_transformed
+        basic[color.isna().to_numpy()] = 'White'
+
+        X['BasicExtColor'] = pd.Categorical(basic, categories=self._base_colors + ['Other'])
+        X.drop('VehColorExt', axis=1, inplace=True)
+
+        return X
 
     
     
@@ -256,107 +477,159 @@ class VehDriveTrainTransform(BaseEstimator, TransformerMixin):
         'AllWheelDrive': 'all_drive','4WD/AWD': 'all_drive'
     }
 
-    def __init__(self):
+    drive_categories = ['front_drive', 'all_drive', 'other']
+
+    def __init__(self, copy=True):
+        self.copy = copy
         self.most_frequent_drive_ = None
-    
+
     def fit(self, X, y=None):
-        X_transformed = X['VehDriveTrain'].replace(self.drivetrain_mapping)
+        # remap over the distinct raw values (O(#categories), not O(n));
+        # anything outside drivetrain_mapping collapses to 'other'
+        cat = X['VehDriveTrain'].astype('category')
+        mapped = cat.map({c: self.drivetrain_mapping.get(c, 'other') for c in cat.cat.categories})
         # Determine the most frequent value after mapping
-        self.most_frequent_drive_ = X_transformed.mode()[0]
+        self.most_frequent_drive_ = mapped.mode()[0]
+        # group the raw keys per target so transform is one np.select pass
+        self._keys_by_cat_ = {
+            drive: np.array([k for k, v in self.drivetrain_mapping.items() if v == drive],
+                            dtype=object)
+            for drive in ('front_drive', 'all_drive')}
         return self
-    
+
     def transform(self, X, y=None):
-        X_transformed = X.copy()
-        
-        X_transformed['VehDrive'] = X_transformed['VehDriveTrain'].replace(self.drivetrain_mapping)
-        X_transformed['VehDrive'].fillna(self.most_frequent_drive_, inplace=True)
-               
-        # Handle unknown categories
-        known_values = set(self.drivetrain_mapping.values())
-        X_transformed.loc[~X_transformed['VehDrive'].isin(known_values), 'VehDrive'] = 'other'
-        
-        X_transformed.drop('VehDriveTrain', axis=1, inplace=True)
-        return X_transformed
+        if self.copy:
+            X = X.copy(deep=False)
+
+        # na_value=np.nan keeps np.isin happy on arrow/nullable dtypes
+        raw = X['VehDriveTrain'].to_numpy(dtype=object, na_value=np.nan)
+        # one fused pass: map known keys, default unknowns to 'other', then
+        # overwrite the NaN positions with the training mode
+        masks = [np.isin(raw, self._keys_by_cat_['front_drive']),
+                 np.isin(raw, self._keys_by_cat_['all_drive'])]
+        drive = np.select(masks, ['front_drive', 'all_drive'], default='other')
+        drive[pd.isna(raw)] = self.most_frequent_drive_
+        X['VehDrive'] = pd.Categorical(drive, categories=self.drive_categories)
+
+        X.drop('VehDriveTrain', axis=1, inplace=True)
+        return X
     
     
     
 class VehMileageTransform(BaseEstimator, TransformerMixin):
     """
     Handles missing values in vehicle mileage by imputing them with the mean value.
+
+    Parameters:
+    ----------
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
-    def __init__(self):
+    def __init__(self, copy=True):
+        self.copy = copy
         self.mileage_mean_ = None
-    
+
     def fit(self, X, y=None):
-        self.mileage_mean_ = X['VehMileage'].mean()
+        self.mileage_mean_ = np.float32(X['VehMileage'].mean())
         return self
-    
+
     def transform(self, X, y=None):
-        X_transformed = X.copy()
-        
-        # impute NaN with mean values computed during fit
-        X_transformed['VehMileage'].fillna(self.mileage_mean_, inplace=True)
-        return X_transformed
+        if self.copy:
+            X = X.copy(deep=False)
+
+        # impute NaN with the fit-time mean in one in-place pass; float32
+        # halves the bytes the downstream scalers/estimators have to move
+        mileage = X['VehMileage'].to_numpy(dtype=np.float32, copy=True)
+        np.nan_to_num(mileage, copy=False, nan=self.mileage_mean_)
+        X['VehMileage'] = mileage
+        return X
 
     
     
 class VehMakeTransform(BaseEstimator, TransformerMixin):
     """
     Transforms vehicle make information to identify specific brands.
+
+    Parameters:
+    ----------
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
+    def __init__(self, copy=True):
+        self.copy = copy
+
     def fit(self, X, y=None):
         return self
-    
+
     def transform(self, X, y=None):
-        X_transformed = X.copy()
-        
-        vehmake_mapping = {"Jeep": 1, "Cadillac": 0}
-        X_transformed['Is_Jeep'] = X_transformed['VehMake'].map(vehmake_mapping)
-        X_transformed.drop('VehMake', axis=1, inplace=True)
-        return X_transformed
+        if self.copy:
+            X = X.copy(deep=False)
+
+        # single vectorized string compare; unknown makes become 0 instead of NaN
+        X['Is_Jeep'] = (X['VehMake'].astype(str) == 'Jeep').to_numpy(dtype=bool).view(np.uint8)
+        X.drop('VehMake', axis=1, inplace=True)
+        return X
     
     
     
 class VehColorInternalTransform(BaseEstimator, TransformerMixin):
     """
     Extracts information about the presence of leather in the internal color description.
+
+    Parameters:
+    ----------
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
+    def __init__(self, copy=True):
+        self.copy = copy
+
     def fit(self, X, y=None):
         return self
 
     def transform(self, X, y=None):
         # in case of NaN --> False
-        X_transformed = X.copy()
-        
-        X_transformed['ContainsLeather'] = X_transformed['VehColorInt'].str.contains('leather', case=False, na=False).astype(bool)
-        X_transformed.drop('VehColorInt', axis=1, inplace=True)
-        X_transformed['ContainsLeather'] = X_transformed['ContainsLeather'].astype(int)
-        return X_transformed
+        if self.copy:
+            X = X.copy(deep=False)
+
+        # literal substring scan (no regex engine), bool buffer viewed as uint8
+        contains = X['VehColorInt'].str.contains('leather', case=False, regex=False, na=False)
+        X['ContainsLeather'] = contains.to_numpy(dtype=bool).view(np.uint8)
+        X.drop('VehColorInt', axis=1, inplace=True)
+        return X
     
     
     
 class VehFeatsTransform(BaseEstimator, TransformerMixin):
     """
     Transforms the vehicle features information by counting the number of features.
+
+    Parameters:
+    ----------
+    copy : bool, default=True
+        If False, mutate the caller's frame instead of working on a copy.
     """
-    def __init__(self):
+    def __init__(self, copy=True):
+        self.copy = copy
         # store most frequent value from train data for imputation
-        self.most_freq_ = None
-    
+        self.most_frequent_ = None
+
     def fit(self, X, y=None):
-        # if Nan -> None
+        # vectorized count: k features means k-1 commas; NaN stays NaN
         # determine most freq value in the train data
-        veh_feats_count = X['VehFeats'].apply(lambda x: len(str(x).split(',')) if not pd.isna(x) else None)
-        self.most_frequent_ = veh_feats_count.mode()[0]
+        veh_feats_count = X['VehFeats'].str.count(',').add(1)
+        self.most_frequent_ = veh_feats_count.mode().iat[0]
         return self
-    
+
     def transform(self, X, y=None):
-        # avoid inplace modification
-        X_transformed = X.copy()
-        
-        X_transformed['VehFeatsCount'] = X_transformed['VehFeats'].apply(lambda x: len(str(x).split(',')) if not pd.isna(x) else None)
+        if self.copy:
+            X = X.copy(deep=False)
+
+        veh_feats_count = X['VehFeats'].str.count(',').add(1).to_numpy(dtype=np.float64,
+                                                                       na_value=np.nan)
         # Use the most frequent value for imputation of NaN values
-        X_transformed['VehFeatsCount'].fillna(self.most_frequent_, inplace=True)
-        X_transformed.drop('VehFeats', axis=1, inplace=True)
-        return X_transformed
+        X['VehFeatsCount'] = np.where(np.isnan(veh_feats_count), self.most_frequent_,
+                                      veh_feats_count).astype(np.int32, copy=False)
+        X.drop('VehFeats', axis=1, inplace=True)
+        return X
     
@@ -0,0 +1,66 @@
+from joblib import Memory
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+from pipeline_helpers.feature_transformations import (
+    SetIndex, DropUnused, LogTransform, BooleanEncoding,
+    AgeFeatureTransform, ArrowStringTransform, VehHistoryTransform,
+    VehEngineTransform, VehColorExtTransform, VehDriveTrainTransform,
+    VehMileageTransform, VehMakeTransform, VehColorInternalTransform,
+    VehFeatsTransform)
+
+CURRENT_YEAR = 2023
+
+INDEX_FEATURE = ['ListingID']
+UNUSED_FEATURES = ['VehTransmission', 'VehBodystyle', 'SellerZip', 'VehType', 'VehSellerNotes',
+                   'VehPriceLabel', 'VehModel', 'SellerIsPriv', 'SellerName', 'SellerCity']
+LOG_TRANSFORM_FEATURES = ['SellerRevCnt', 'VehListdays']
+BOOLEAN_FEATURES = ['VehCertified']
+ONE_HOT_FEATURES = ['SellerListSrc', 'SellerState', 'VehFuel', 'VehDrive',
+                    'BasicExtColor', 'Engine_Category']
+# string columns consumed by the custom transformers below; kept off the
+# one-hot passthrough columns, whose encoder cannot handle arrow NA values
+STRING_FEATURES = ['VehDriveTrain', 'VehFeats', 'VehColorExt', 'VehColorInt',
+                   'VehEngine', 'VehHistory']
+
+
+def build_preprocessing_pipeline(cache_dir='./.sk_cache'):
+    """
+    Builds the feature-preprocessing Pipeline used by the training notebooks.
+
+    The fitted transformers are cached on disk with joblib.Memory so that
+    repeated fits during grid/Bayesian search reuse previous results instead
+    of recomputing every step. All transformers keep only small fitted
+    attributes (means, modes, mapping dicts), so the cache stays cheap.
+
+    Parameters:
+    ----------
+    cache_dir : str or None, default='./.sk_cache'
+        Directory for the joblib cache. Pass None to disable caching.
+
+    Returns:
+    -------
+    sklearn.pipeline.Pipeline
+    """
+    memory = Memory(location=cache_dir, verbose=0) if cache_dir is not None else None
+
+    return Pipeline([
+        ("arrow_strings", ArrowStringTransform(features=STRING_FEATURES)),
+        ("set_index", SetIndex(index_feature=INDEX_FEATURE)),
+        ("drop_unused", DropUnused(features=UNUSED_FEATURES)),
+        ("log_transform", LogTransform(features=LOG_TRANSFORM_FEATURES)),
+        ("age_feature", AgeFeatureTransform(current_year=CURRENT_YEAR)),
+        ("boolean_encode", BooleanEncoding(features=BOOLEAN_FEATURES)),
+        ('veh_drive_train_transform', VehDriveTrainTransform()),
+        ('veh_feats_transform', VehFeatsTransform()),
+        ('veh_color_ext_transform', VehColorExtTransform()),
+        ('veh_color_int_transform', VehColorInternalTransform()),
+        ('veh_engine_transform', VehEngineTransform()),
+        ('veh_make_transform', VehMakeTransform()),
+        ('veh_mileage_transform', VehMileageTransform()),
+        ('veh_history_transform', VehHistoryTransform()),
+        ("column_transformer", ColumnTransformer([
+            ("one_hot_encode", OneHotEncoder(handle_unknown='ignore', dtype=int),
+             ONE_HOT_FEATURES)], remainder='passthrough'))],
+        memory=memory)
@@ -39,9 +39,7 @@ def preprocessing_target_variables(df):
 
         'High Altitude': 'Altitude'}
 
-    # Replace and groupby
-    df_copy['Vehicle_Trim'] = df_copy['Vehicle_Trim'].replace(jeep_mapping)
-    # dropping 
+    # dropping
     jeep_drop_trims = ['75th Anniversary Edition', 'Upland','75th Anniversary','Sterling Edition']
 
     df_copy = df_copy[~df_copy['Vehicle_Trim'].isin(jeep_drop_trims)]
@@ -62,7 +60,10 @@ def preprocessing_target_variables(df):
         'Platinum': 'Platinum',
         'Platinum AWD': 'Platinum'}
 
-    # Replace and groupby
-    df_copy['Vehicle_Trim'] = df_copy['Vehicle_Trim'].replace(cadillac_mapping)
-    
+    # Replace and groupby: one map over the distinct trims (O(#categories),
+    # not a full .replace scan per mapping) with unmapped trims kept as-is
+    combined_mapping = {**jeep_mapping, **cadillac_mapping}
+    trim = df_copy['Vehicle_Trim'].astype('category')
+    df_copy['Vehicle_Trim'] = trim.map({c: combined_mapping.get(c, c) for c in trim.cat.categories})
+
     return df_copy
\ No newline at end of file